@@ -1,14 +1,58 @@
 import base64
+import functools
 import json
 import logging
+import os
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import boto3
 import s3fs
 import tornado
+from botocore.config import Config
 from botocore.exceptions import NoCredentialsError, ClientError
 from jupyter_server.base.handlers import APIHandler
 from jupyter_server.utils import url_path_join
+from tornado.ioloop import IOLoop
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# head_bucket probes are network bound, so fan out well past the cpu count
+BUCKET_PROBE_WORKERS = 64
+
+# seconds to trust a role access probe before hitting S3 again
+ROLE_ACCESS_CACHE_TTL = 300
+_ROLE_ACCESS_CACHE = {"value": None, "expires": 0}
+_CREDENTIALS_FILE_CACHE = {}
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+# blocking boto and s3fs calls run here so they don't stall the tornado event loop
+S3_EXECUTOR = ThreadPoolExecutor(max_workers=32)
+
+
+def run_blocking(func, *args, **kwargs):
+    """
+    Runs a blocking call on S3_EXECUTOR and returns an awaitable for its result.
+    """
+    return IOLoop.current().run_in_executor(S3_EXECUTOR, functools.partial(func, *args, **kwargs))
+
+
+def json_dumps(obj):
+    """
+    Serializes obj with orjson when it is installed, falling back to the stdlib encoder.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj)
 
 
 class DirectoryNotEmptyException(Exception):
@@ -16,72 +60,237 @@ class DirectoryNotEmptyException(Exception):
     pass
 
 
+S3Config = namedtuple("S3Config", ["endpoint_url", "client_id", "client_secret", "session_token"])
+
+# multiple of 3 so each chunk base64 encodes without padding
+STREAM_CHUNK_SIZE = 3 * 64 * 1024
+
+# seconds before a cached s3fs listing is refetched, so the browser's periodic
+# refresh still picks up buckets and objects created by other tools. Listings inside
+# a bucket go straight to S3 through list_directory, so the s3fs dircache only backs
+# the root bucket list and the lookups s3fs does itself for open, cp and move.
+S3FS_LISTINGS_EXPIRY = 60
+
+# standard retry mode backs off on throttling instead of hammering the endpoint,
+# and explicit timeouts keep a bad endpoint from hanging a request
+S3FS_CONFIG_KWARGS = {
+    "max_pool_connections": 50,
+    "retries": {"mode": "standard", "max_attempts": 5},
+    "connect_timeout": 3,
+    "read_timeout": 10,
+}
+
+BOTO_CONFIG = Config(
+    retries={"mode": "standard", "max_attempts": 5},
+    connect_timeout=3,
+    read_timeout=10,
+    max_pool_connections=BUCKET_PROBE_WORKERS,
+)
+
+
 def create_s3fs(config):
+    # skip_instance_cache: instances are shared through _get_s3fs, which
+    # reset_s3_clients clears; fsspec's own cache would hand back the stale one.
+    #
+    # no region is pinned here: botocore's region redirector caches each bucket's
+    # region on the client, and clients are shared per config, so a bucket outside
+    # the default region only pays for the redirect once per process
     if config.endpoint_url and config.client_id and config.client_secret:
         return s3fs.S3FileSystem(
             key=config.client_id,
             secret=config.client_secret,
             token=config.session_token,
             client_kwargs={"endpoint_url": config.endpoint_url},
+            config_kwargs=S3FS_CONFIG_KWARGS,
+            listings_expiry_time=S3FS_LISTINGS_EXPIRY,
+            skip_instance_cache=True,
         )
     else:
-        return s3fs.S3FileSystem()
+        return s3fs.S3FileSystem(
+            config_kwargs=S3FS_CONFIG_KWARGS,
+            listings_expiry_time=S3FS_LISTINGS_EXPIRY,
+            skip_instance_cache=True,
+        )
+
+
+@functools.lru_cache(maxsize=8)
+def _get_s3fs(s3_config):
+    return create_s3fs(s3_config)
+
+
+def get_s3fs(config):
+    """
+    Returns an S3FileSystem for the given config, shared across requests.
+    """
+    return _get_s3fs(
+        S3Config(config.endpoint_url, config.client_id, config.client_secret, config.session_token)
+    )
+
+
+def get_session():
+    """
+    Returns the boto3 session shared by every client, so the credential chain
+    (env, shared files, instance metadata) is resolved once rather than per client.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = boto3.session.Session()
+        return _SESSION
+
+
+def create_s3_client(**kwargs):
+    # sessions aren't thread safe, but the clients they build are
+    session = get_session()
+    with _SESSION_LOCK:
+        return session.client("s3", config=BOTO_CONFIG, **kwargs)
 
 
 def create_s3_resource(config):
-    if config.endpoint_url and config.client_id and config.client_secret:
-        return boto3.resource(
-            "s3",
-            aws_access_key_id=config.client_id,
-            aws_secret_access_key=config.client_secret,
-            aws_session_token=config.session_token,
-            endpoint_url=config.endpoint_url,
-        )
-    else:
-        return boto3.resource("s3")
+    session = get_session()
+    with _SESSION_LOCK:
+        if config.endpoint_url and config.client_id and config.client_secret:
+            return session.resource(
+                "s3",
+                aws_access_key_id=config.client_id,
+                aws_secret_access_key=config.client_secret,
+                aws_session_token=config.session_token,
+                endpoint_url=config.endpoint_url,
+                config=BOTO_CONFIG,
+            )
+        else:
+            return session.resource("s3", config=BOTO_CONFIG)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_s3_resource(s3_config):
+    return create_s3_resource(s3_config)
+
+
+def get_s3_resource(config):
+    """
+    Returns a boto3 S3 resource for the given config, shared across requests.
+    """
+    return _get_s3_resource(
+        S3Config(config.endpoint_url, config.client_id, config.client_secret, config.session_token)
+    )
+
+
+def check_bucket_access(s3, bucket_name):
+    """
+    Returns true if the given client can access the bucket, false if access is denied
+    or the bucket is gone. Any other error, such as bad credentials, is raised.
+    """
+    try:
+        s3.head_bucket(Bucket=bucket_name)
+        return True
+    except ClientError as e:
+        # head_bucket has no body, so errors surface as bare status codes
+        code = e.response["Error"]["Code"]
+        if code in ("AccessDenied", "403"):
+            logging.info(f"Access denied for bucket: {bucket_name}")
+            return False
+        if code in ("NoSuchBucket", "404"):
+            return False
+        raise e
+
+
+def _accessible_buckets(s3, bucket_names):
+    """
+    Checks the given buckets in parallel and returns the accessible ones in Jupyter format.
+    """
+    with ThreadPoolExecutor(max_workers=BUCKET_PROBE_WORKERS) as executor:
+        results = executor.map(lambda name: (name, check_bucket_access(s3, name)), bucket_names)
+        return [
+            {"name": name + "/", "path": name + "/", "type": "directory"}
+            for name, accessible in results
+            if accessible
+        ]
+
+
+def _log_accessible_buckets(s3, buckets):
+    """
+    Logs which of the given buckets the client can access. Probing every bucket is only
+    worth it when someone will read the result, so this does nothing below DEBUG.
+    """
+    if not logging.getLogger().isEnabledFor(logging.DEBUG):
+        return
+    try:
+        logging.debug(_accessible_buckets(s3, (bucket["Name"] for bucket in buckets)))
+    except Exception as e:
+        # a diagnostic probe must not change the authentication result
+        logging.debug(f"Could not probe bucket access: {e}")
 
 
 def _test_aws_s3_role_access():
     """
-    Checks if we have access to AWS S3 through role-based access and lists only accessible buckets.
+    Checks if we have access to AWS S3 through role-based access.
+    If not, it throws an exception.
     """
-    s3 = boto3.client("s3")
-    all_buckets = s3.list_buckets()["Buckets"]
-    accessible_buckets = []
+    s3 = create_s3_client()
+    _log_accessible_buckets(s3, s3.list_buckets()["Buckets"])
 
-    for bucket in all_buckets:
-        try:
-            # Try to list objects in the bucket to verify access
-            s3.list_objects_v2(Bucket=bucket["Name"], MaxKeys=1)
-            accessible_buckets.append(
-                {"name": bucket["Name"] + "/", "path": bucket["Name"] + "/", "type": "directory"}
-            )
-        except ClientError as e:
-            # Ignore access denied errors
-            if e.response["Error"]["Code"] == "AccessDenied":
-                logging.info(f"Access denied for bucket: {bucket['Name']}")
-            else:
-                raise e
 
-    return accessible_buckets
+def invalidate_auth_cache():
+    """
+    Forgets the cached role access result, so the next check probes S3 again.
+    """
+    _ROLE_ACCESS_CACHE["value"] = None
+    _ROLE_ACCESS_CACHE["expires"] = 0
 
 
-def has_aws_s3_role_access():
+def reset_s3_clients():
+    """
+    Drops the shared boto3 session along with every S3FileSystem and resource cached
+    from it, so the next request resolves credentials from scratch.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        _SESSION = None
+    _get_s3fs.cache_clear()
+    _get_s3_resource.cache_clear()
+
+
+def _has_valid_credentials_file(aws_credentials_file):
+    """
+    Returns false if ~/.aws/credentials holds an access key id that isn't an AWS one.
+    The result is cached until the file is modified; a modification also resets the
+    cached clients, since they hold credentials resolved from the old file.
     """
-    Returns true if the user has access to an aws S3 bucket
-    """
-    aws_credentials_file = Path("{}/.aws/credentials".format(Path.home()))
-    if aws_credentials_file.exists():
-        with aws_credentials_file.open() as credentials_file:
-            for line in credentials_file.readlines():
-                if line.startswith("aws_access_key_id"):
-                    access_key_id = line.split("=", 1)[1].strip()
-                    if not access_key_id.startswith("AKIA") and not access_key_id.startswith("ASIA"):
-                        logging.info(
-                            "Found invalid AWS aws_access_key_id in ~/.aws/credentials file, "
-                            "will not attempt to authenticate through ~/.aws/credentials."
-                        )
-                        return False
+    try:
+        cache_key = (str(aws_credentials_file), aws_credentials_file.stat().st_mtime_ns)
+    except FileNotFoundError:
+        cache_key = (str(aws_credentials_file), None)
+    if cache_key in _CREDENTIALS_FILE_CACHE:
+        return _CREDENTIALS_FILE_CACHE[cache_key]
+    if _CREDENTIALS_FILE_CACHE:
+        reset_s3_clients()
+
+    valid = True
+    lines = aws_credentials_file.read_text().splitlines() if cache_key[1] is not None else []
+    for line in lines:
+        if line.startswith("aws_access_key_id"):
+            access_key_id = line.split("=", 1)[1].strip()
+            if not access_key_id.startswith(("AKIA", "ASIA")):
+                logging.info(
+                    "Found invalid AWS aws_access_key_id in ~/.aws/credentials file, "
+                    "will not attempt to authenticate through ~/.aws/credentials."
+                )
+                valid = False
+                break
+
+    _CREDENTIALS_FILE_CACHE.clear()
+    _CREDENTIALS_FILE_CACHE[cache_key] = valid
+    return valid
+
+
+def _aws_credentials_file():
+    return Path("{}/.aws/credentials".format(Path.home()))
+
+
+def _check_aws_s3_role_access():
+    if not _has_valid_credentials_file(_aws_credentials_file()):
+        return False
 
     try:
         _test_aws_s3_role_access()
@@ -92,37 +301,33 @@ def has_aws_s3_role_access():
         logging.error(e)
         return False
 
-def check_bucket_access(bucket_name):
-    # Initialize a session using Amazon S3
-    s3 = boto3.client('s3')
-    
-    try:
-        # Try to access the bucket by listing its contents
-        s3.head_bucket(Bucket=bucket_name)
-        return True
-    except:
-        return False
-    
+
+def has_aws_s3_role_access():
+    """
+    Returns true if the user has access to an aws S3 bucket.
+    The result is cached for ROLE_ACCESS_CACHE_TTL seconds.
+    """
+    if time.monotonic() < _ROLE_ACCESS_CACHE["expires"]:
+        return _ROLE_ACCESS_CACHE["value"]
+
+    value = _check_aws_s3_role_access()
+    _ROLE_ACCESS_CACHE["value"] = value
+    _ROLE_ACCESS_CACHE["expires"] = time.monotonic() + ROLE_ACCESS_CACHE_TTL
+    return value
+
 
 def test_s3_credentials(endpoint_url, client_id, client_secret, session_token):
     """
     Checks if we're able to list buckets with these credentials.
     If not, it throws an exception.
     """
-    test = boto3.resource(
-        "s3",
+    test = create_s3_client(
         aws_access_key_id=client_id,
         aws_secret_access_key=client_secret,
         endpoint_url=endpoint_url,
         aws_session_token=session_token,
     )
-    all_buckets = test.buckets.all()
-    logging.debug(
-        [
-            {"name": bucket.name + "/", "path": bucket.name + "/", "type": "directory"}
-            for bucket in all_buckets if check_bucket_access(bucket.name)
-        ]
-    )
+    _log_accessible_buckets(test, test.list_buckets()["Buckets"])
 
 
 class AuthHandler(APIHandler):  # pylint: disable=abstract-method
@@ -131,19 +336,20 @@ class AuthHandler(APIHandler):  # pylint: disable=abstract-method
         return self.settings["s3_config"]
 
     @tornado.web.authenticated
-    def get(self, path=""):
+    async def get(self, path=""):
         """
         Checks if the user is already authenticated against an s3 instance.
         """
         authenticated = False
-        if has_aws_s3_role_access():
+        if await run_blocking(has_aws_s3_role_access):
             authenticated = True
 
         if not authenticated:
             try:
                 config = self.config
                 if config.endpoint_url and config.client_id and config.client_secret:
-                    test_s3_credentials(
+                    await run_blocking(
+                        test_s3_credentials,
                         config.endpoint_url,
                         config.client_id,
                         config.client_secret,
@@ -156,6 +362,10 @@ class AuthHandler(APIHandler):  # pylint: disable=abstract-method
                 logging.debug("...failed to authenticate")
                 logging.debug(err)
 
+        if not authenticated:
+            # don't let a cached negative outlive the credentials being fixed
+            invalidate_auth_cache()
+
         self.finish(json.dumps({"authenticated": authenticated}))
 
 
@@ -163,12 +373,135 @@ class S3ResourceNotFoundException(Exception):
     pass
 
 
-def convertS3FStoJupyterFormat(result):
-    return {
-        "name": result["Key"].rsplit("/", 1)[-1],
-        "path": result["Key"],
-        "type": result["type"],
-    }
+class S3DeleteException(Exception):
+    """Raise when S3 refuses to delete some of the requested keys"""
+    pass
+
+
+# error bodies that never vary are serialized once up front
+NOT_FOUND_ERROR = b'{"error": 404, "message": "The requested resource could not be found."}'
+# the frontend matches on this error string when a delete is refused
+DIR_NOT_EMPTY_ERROR = b'{"error": "DIR_NOT_EMPTY"}'
+
+
+def convertS3FSListingToJupyterFormat(listing):
+    """
+    Yields a Jupyter model for each s3fs listing entry, skipping entries without a name.
+    """
+    for result in listing:
+        key = result["Key"]
+        name = key.rsplit("/", 1)[-1]
+        if name:
+            yield {"name": name, "path": key, "type": result["type"]}
+
+
+def iter_file_model(path, f):
+    """
+    Yields the JSON file model for path as bytes: the opening fields, then the content
+    of the file object f base64 encoded STREAM_CHUNK_SIZE bytes at a time, then the
+    closing quote and brace. The first chunk is read before anything is yielded.
+    """
+    chunk = f.read(STREAM_CHUNK_SIZE)
+    yield ('{"path": %s, "type": "file", "content": "' % json.dumps(path)).encode("utf-8")
+    while chunk:
+        yield base64.b64encode(chunk)
+        chunk = f.read(STREAM_CHUNK_SIZE)
+    yield b'"}'
+
+
+def list_directory(client, path):
+    """
+    Lists the immediate children of a path inside a bucket using only LIST calls,
+    returning entries shaped like s3fs.listdir results.
+    Raises FileNotFoundError for a missing bucket or a prefix with nothing under it,
+    as s3fs.listdir does.
+    """
+    bucket_name, _, key = path.strip("/").partition("/")
+    prefix = key.rstrip("/") + "/" if key else ""
+    paginator = client.get_paginator("list_objects_v2")
+    listing = []
+    try:
+        for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix, Delimiter="/"):
+            for common_prefix in page.get("CommonPrefixes", []):
+                listing.append(
+                    {"Key": bucket_name + "/" + common_prefix["Prefix"].rstrip("/"), "type": "directory"}
+                )
+            for obj in page.get("Contents", []):
+                listing.append({"Key": bucket_name + "/" + obj["Key"], "type": "file"})
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "NoSuchBucket":
+            raise FileNotFoundError(path)
+        raise e
+    # an empty directory still holds its marker or .keep, so nothing at all means
+    # the prefix doesn't exist
+    if prefix and not listing:
+        raise FileNotFoundError(path)
+    return listing
+
+
+def delete_keys(client, bucket_name, keys):
+    """
+    Deletes the given keys with a single DeleteObjects call.
+    DeleteObjects answers 200 even when individual keys fail, so those failures are raised here.
+    """
+    response = client.delete_objects(Bucket=bucket_name, Delete={"Objects": [{"Key": k} for k in keys]})
+    errors = response.get("Errors", [])
+    if not errors:
+        return
+    if all(error["Code"] == "NoSuchKey" for error in errors):
+        raise S3ResourceNotFoundException(f"{bucket_name}/{errors[0]['Key']}")
+    error = errors[0]
+    raise S3DeleteException(
+        f"Could not delete {bucket_name}/{error['Key']}: {error['Code']} {error.get('Message', '')}"
+    )
+
+
+def object_exists(client, bucket_name, key):
+    """
+    Returns true if the object exists. Other errors, such as access denied, are raised.
+    """
+    try:
+        client.head_object(Bucket=bucket_name, Key=key)
+        return True
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+            return False
+        raise e
+
+
+def delete_path(client, path):
+    """
+    Deletes the object, empty directory or empty bucket at path.
+    Raises DirectoryNotEmptyException if there is anything besides a directory marker
+    and a .keep placeholder under it, and S3ResourceNotFoundException if it doesn't exist.
+    """
+    # three keys are enough to see past a directory marker and a .keep placeholder
+    bucket_name, _, key = path.strip("/").partition("/")
+    prefix = key + "/" if key else ""
+    try:
+        response = client.list_objects_v2(Bucket=bucket_name, Prefix=prefix, MaxKeys=3)
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "NoSuchBucket":
+            raise S3ResourceNotFoundException(path)
+        raise e
+    keys = [obj["Key"] for obj in response.get("Contents", [])]
+
+    if not {prefix, prefix + ".keep"}.issuperset(keys):
+        raise DirectoryNotEmptyException()
+    if key and not keys:
+        # nothing under the prefix, so the path is a plain object, and
+        # DeleteObjects won't tell us if it was never there
+        if not object_exists(client, bucket_name, key):
+            raise S3ResourceNotFoundException(path)
+        keys = [key]
+
+    # for some reason s3fs.rm doesn't work reliably, so remove everything
+    # the listing turned up in a single DeleteObjects call
+    if keys:
+        delete_keys(client, bucket_name, keys)
+    if not key:
+        # the bucket itself, now that it's empty
+        client.delete_bucket(Bucket=bucket_name)
 
 
 class S3Handler(APIHandler):
@@ -179,44 +512,96 @@ class S3Handler(APIHandler):
     s3fs = None
     s3_resource = None
 
+    async def _load_clients(self):
+        """
+        Fetches the shared clients for this config, building them off the event loop
+        the first time round. The credentials file is checked first, so clients are
+        rebuilt as soon as it changes rather than when the role access cache expires.
+        """
+        await run_blocking(_has_valid_credentials_file, _aws_credentials_file())
+        self.s3fs = await run_blocking(get_s3fs, self.config)
+        self.s3_resource = await run_blocking(get_s3_resource, self.config)
+
+    def _invalidate_parent(self, path):
+        """
+        Drops the s3fs cached listings of a changed path and the directory containing it,
+        which keeps the root bucket list and s3fs's own lookups in step with our writes.
+        """
+        path = path.strip("/")
+        self.s3fs.invalidate_cache(path)
+        self.s3fs.invalidate_cache(os.path.dirname(path))
+
+    def _finish_error(self, status, body):
+        """
+        Finishes the request with a real HTTP error status and a pre-serialized JSON body.
+        """
+        self.set_status(status)
+        self.finish(body)
+
+    async def _stream_file(self, path):
+        """
+        Finishes the request with a file model, base64 encoding the object chunk by chunk
+        so it is never held in memory whole.
+        Errors before the first chunk is read propagate as usual; once the body has started,
+        a failure aborts the connection so the client sees a broken transfer, not a short 200.
+        """
+        f = await run_blocking(self.s3fs.open, path, "rb")
+        try:
+            # each next() reads from S3, so the generator is stepped on the executor
+            pieces = iter_file_model(path, f)
+            prelude = await run_blocking(next, pieces)
+            self.set_header("Content-Type", "application/json")
+            self.write(prelude)
+            try:
+                piece = await run_blocking(next, pieces, None)
+                while piece is not None:
+                    self.write(piece)
+                    await self.flush()
+                    piece = await run_blocking(next, pieces, None)
+            except Exception as e:
+                logging.error(f"Exception encountered while streaming {path}: {e}")
+                self.request.connection.close()
+                return
+            self.finish()
+        finally:
+            await run_blocking(f.close)
+
     @tornado.web.authenticated
-    def get(self, path=""):
+    async def get(self, path=""):
         """
         Takes a path and returns lists of files/objects
         and directories/prefixes based on the path.
+        The root bucket list is served from the s3fs cache unless ?refresh=1 is passed;
+        listings inside a bucket are always fetched fresh.
         """
         path = path
 
         try:
-            if not self.s3fs:
-                self.s3fs = create_s3fs(self.config)
+            await self._load_clients()
 
-            self.s3fs.invalidate_cache()
+            if self.get_query_argument("refresh", "0") == "1":
+                self.s3fs.invalidate_cache(path.strip("/"))
 
             if (path and not path.endswith("/")) and ("X-Custom-S3-Is-Dir" not in self.request.headers):
-                with self.s3fs.open(path, "rb") as f:
-                    result = {
-                        "path": path,
-                        "type": "file",
-                        "content": base64.encodebytes(f.read()).decode("ascii"),
-                    }
+                await self._stream_file(path)
+                return
             else:
-                raw_result = list(map(convertS3FStoJupyterFormat, self.s3fs.listdir(path)))
-                result = list(filter(lambda x: x["name"] != "", raw_result))
+                if path.strip("/"):
+                    listing = await run_blocking(list_directory, self.s3_resource.meta.client, path)
+                else:
+                    listing = await run_blocking(self.s3fs.listdir, path)
+                result = list(convertS3FSListingToJupyterFormat(listing))
 
-        except S3ResourceNotFoundException as e:
-            result = {
-                "error": 404,
-                "message": "The requested resource could not be found.",
-            }
+        except (S3ResourceNotFoundException, FileNotFoundError):
+            self._finish_error(404, NOT_FOUND_ERROR)
         except Exception as e:
             logging.error(f"Exception encountered during GET {path}: {e}")
-            result = {"error": 500, "message": str(e)}
-
-        self.finish(json.dumps(result))
+            self._finish_error(500, json_dumps({"error": 500, "message": str(e)}))
+        else:
+            self.finish(json_dumps(result))
 
     @tornado.web.authenticated
-    def put(self, path=""):
+    async def put(self, path=""):
         """
         Takes a path and returns lists of files/objects
         and directories/prefixes based on the path.
@@ -226,61 +611,51 @@ class S3Handler(APIHandler):
         result = {}
 
         try:
-            if not self.s3fs:
-                self.s3fs = create_s3fs(self.config)
+            await self._load_clients()
 
             if "X-Custom-S3-Copy-Src" in self.request.headers:
                 source = self.request.headers["X-Custom-S3-Copy-Src"]
                 if "/" not in source:
                     path = path + "/.keep"
-                self.s3fs.cp(source, path, recursive=True)
-                with self.s3fs.open(path, "rb") as f:
-                    result = {
-                        "path": path,
-                        "type": "file",
-                        "content": base64.encodebytes(f.read()).decode("ascii"),
-                    }
+                await run_blocking(self.s3fs.cp, source, path, recursive=True)
+                self._invalidate_parent(path)
+                await self._stream_file(path)
+                return
             elif "X-Custom-S3-Move-Src" in self.request.headers:
                 source = self.request.headers["X-Custom-S3-Move-Src"]
-                self.s3fs.move(source, path, recursive=True)
-                with self.s3fs.open(path, "rb") as f:
-                    result = {
-                        "path": path,
-                        "type": "file",
-                        "content": base64.encodebytes(f.read()).decode("ascii"),
-                    }
+                await run_blocking(self.s3fs.move, source, path, recursive=True)
+                self._invalidate_parent(source)
+                self._invalidate_parent(path)
+                await self._stream_file(path)
+                return
             elif "X-Custom-S3-Is-Dir" in self.request.headers:
                 path = path.lower()
                 if not path.endswith("/"):
                     path = path + "/"
-                self.s3fs.mkdir(path)
-                self.s3fs.touch(path + ".keep")
+                await run_blocking(self.s3fs.mkdir, path)
+                await run_blocking(self.s3fs.touch, path + ".keep")
+                self._invalidate_parent(path)
             elif self.request.body:
                 request = json.loads(self.request.body)
-                with self.s3fs.open(path, "w") as f:
-                    f.write(request["content"])
-                    result = {
-                        "path": path,
-                        "type": "file",
-                        "content": request["content"],
-                    }
-
-        except S3ResourceNotFoundException as e:
-            result = {
-                "error": 404,
-                "message": "The requested resource could not be found.",
-            }
-        except DirectoryNotEmptyException as e:
-            result = {"error": 400, "message": "Directory not empty"}
+                await run_blocking(self.s3fs.pipe, path, request["content"].encode("utf-8"))
+                self._invalidate_parent(path)
+                result = {
+                    "path": path,
+                    "type": "file",
+                    "content": request["content"],
+                }
+
+        except (S3ResourceNotFoundException, FileNotFoundError):
+            self._finish_error(404, NOT_FOUND_ERROR)
         except Exception as e:
             logging.error("error while deleting")
             logging.error(e)
-            result = {"error": 500, "message": str(e)}
-
-        self.finish(json.dumps(result))
+            self._finish_error(500, json_dumps({"error": 500, "message": str(e)}))
+        else:
+            self.finish(json_dumps(result))
 
     @tornado.web.authenticated
-    def delete(self, path=""):
+    async def delete(self, path=""):
         """
         Takes a path and returns lists of files/objects
         and directories/prefixes based on the path.
@@ -291,52 +666,23 @@ class S3Handler(APIHandler):
         result = {}
 
         try:
-            if not self.s3fs:
-                self.s3fs = create_s3fs(self.config)
-            if not self.s3_resource:
-                self.s3_resource = create_s3_resource(self.config)
-
-            if self.s3fs.exists(path + "/.keep"):
-                self.s3fs.rm(path + "/.keep")
-
-            objects_matching_prefix = self.s3fs.listdir(path + "/")
-            is_directory = (len(objects_matching_prefix) > 1) or (
-                (len(objects_matching_prefix) == 1)
-                and objects_matching_prefix[0]["Key"] != path
-            )
+            await self._load_clients()
 
-            if is_directory:
-                if (len(objects_matching_prefix) > 1) or (
-                    (len(objects_matching_prefix) == 1)
-                    and objects_matching_prefix[0]["Key"] != path + "/"
-                ):
-                    raise DirectoryNotEmptyException()
-                else:
-                    # for some reason s3fs.rm doesn't work reliably
-                    if path.count("/") > 1:
-                        bucket_name, prefix = path.split("/", 1)
-                        bucket = self.s3_resource.Bucket(bucket_name)
-                        bucket.objects.filter(Prefix=prefix).delete()
-                    else:
-                        self.s3fs.rm(path)
-            else:
-                self.s3fs.rm(path)
+            await run_blocking(delete_path, self.s3_resource.meta.client, path)
+            self._invalidate_parent(path)
 
         except S3ResourceNotFoundException as e:
             logging.error(e)
-            result = {
-                "error": 404,
-                "message": "The requested resource could not be found.",
-            }
-        except DirectoryNotEmptyException as e:
+            self._finish_error(404, NOT_FOUND_ERROR)
+        except DirectoryNotEmptyException:
             #  logging.info("Attempted to delete non-empty directory")
-            result = {"error": 400, "error": "DIR_NOT_EMPTY"}
+            self._finish_error(400, DIR_NOT_EMPTY_ERROR)
         except Exception as e:
             logging.error("error while deleting")
             logging.error(e)
-            result = {"error": 500, "message": str(e)}
-
-        self.finish(json.dumps(result))
+            self._finish_error(500, json_dumps({"error": 500, "message": str(e)}))
+        else:
+            self.finish(json_dumps(result))
 
 
 def setup_handlers(web_app):
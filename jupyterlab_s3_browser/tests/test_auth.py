@@ -1,19 +1,59 @@
+import boto3
 import pytest
 from moto import mock_s3
 
 import jupyterlab_s3_browser
 
+
+@pytest.fixture(autouse=True)
+def clear_auth_cache():
+    jupyterlab_s3_browser.handlers.invalidate_auth_cache()
+    jupyterlab_s3_browser.handlers.reset_s3_clients()
+    yield
+    jupyterlab_s3_browser.handlers.invalidate_auth_cache()
+    jupyterlab_s3_browser.handlers.reset_s3_clients()
+
+
 #  class TestTest(object):
 #  def test_succeed(self):
 #  assert True
 
 
 def test_not_has_aws_s3_role_access_when_unauthenticated():
-    if jupyterlab_s3_browser.has_aws_s3_role_access():
+    if jupyterlab_s3_browser.handlers.has_aws_s3_role_access():
         pytest.fail("authenticated")
 
 
 @mock_s3
 def test_has_aws_s3_role_access_when_authenticated():
-    if not jupyterlab_s3_browser.has_aws_s3_role_access():
+    if not jupyterlab_s3_browser.handlers.has_aws_s3_role_access():
         pytest.fail("not authenticated")
+
+
+@mock_s3
+def test_has_aws_s3_role_access_is_cached(monkeypatch):
+    assert jupyterlab_s3_browser.handlers.has_aws_s3_role_access()
+
+    def fail():
+        pytest.fail("role access was probed again")
+
+    monkeypatch.setattr(jupyterlab_s3_browser.handlers, "_test_aws_s3_role_access", fail)
+    assert jupyterlab_s3_browser.handlers.has_aws_s3_role_access()
+
+
+@mock_s3
+def test_check_bucket_access():
+    s3 = boto3.client("s3")
+    s3.create_bucket(Bucket="test")
+
+    assert jupyterlab_s3_browser.handlers.check_bucket_access(s3, "test")
+    assert not jupyterlab_s3_browser.handlers.check_bucket_access(s3, "missing")
+
+
+def test_reset_s3_clients_rebuilds_s3fs():
+    config = jupyterlab_s3_browser.handlers.S3Config("", "", "", "")
+    s3 = jupyterlab_s3_browser.handlers.get_s3fs(config)
+    assert jupyterlab_s3_browser.handlers.get_s3fs(config) is s3
+
+    jupyterlab_s3_browser.handlers.reset_s3_clients()
+    assert jupyterlab_s3_browser.handlers.get_s3fs(config) is not s3
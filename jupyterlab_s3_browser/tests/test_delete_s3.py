@@ -0,0 +1,77 @@
+import boto3
+import pytest
+from moto import mock_s3
+
+from jupyterlab_s3_browser.handlers import (
+    DirectoryNotEmptyException,
+    S3ResourceNotFoundException,
+    delete_path,
+)
+
+
+@pytest.fixture
+def s3():
+    with mock_s3():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket="test")
+        yield client
+
+
+def keys_in(s3, bucket_name="test"):
+    return sorted(obj["Key"] for obj in s3.list_objects_v2(Bucket=bucket_name).get("Contents", []))
+
+
+def test_delete_object(s3):
+    s3.put_object(Bucket="test", Key="dir/test1.txt", Body=b"test")
+    s3.put_object(Bucket="test", Key="dir/test2.txt", Body=b"test")
+
+    delete_path(s3, "/test/dir/test1.txt")
+    assert keys_in(s3) == ["dir/test2.txt"]
+
+
+def test_delete_missing_object(s3):
+    with pytest.raises(S3ResourceNotFoundException):
+        delete_path(s3, "/test/missing.txt")
+
+
+@pytest.mark.parametrize(
+    "placeholders", [["dir/"], ["dir/.keep"], ["dir/", "dir/.keep"]], ids=["marker", "keep", "marker-and-keep"]
+)
+def test_delete_empty_directory(s3, placeholders):
+    for key in placeholders:
+        s3.put_object(Bucket="test", Key=key, Body=b"")
+    s3.put_object(Bucket="test", Key="dir2/test.txt", Body=b"test")
+
+    delete_path(s3, "/test/dir")
+    assert keys_in(s3) == ["dir2/test.txt"]
+
+
+@pytest.mark.parametrize("extra", ["dir/test.txt", "dir/!first.txt", "dir/nested/test.txt"])
+def test_delete_non_empty_directory(s3, extra):
+    s3.put_object(Bucket="test", Key="dir/", Body=b"")
+    s3.put_object(Bucket="test", Key="dir/.keep", Body=b"")
+    s3.put_object(Bucket="test", Key=extra, Body=b"test")
+
+    with pytest.raises(DirectoryNotEmptyException):
+        delete_path(s3, "/test/dir")
+    assert keys_in(s3) == sorted(["dir/", "dir/.keep", extra])
+
+
+def test_delete_empty_bucket(s3):
+    s3.put_object(Bucket="test", Key=".keep", Body=b"")
+
+    delete_path(s3, "/test")
+    assert s3.list_buckets()["Buckets"] == []
+
+
+def test_delete_non_empty_bucket(s3):
+    s3.put_object(Bucket="test", Key="test.txt", Body=b"test")
+
+    with pytest.raises(DirectoryNotEmptyException):
+        delete_path(s3, "/test")
+    assert keys_in(s3) == ["test.txt"]
+
+
+def test_delete_missing_bucket(s3):
+    with pytest.raises(S3ResourceNotFoundException):
+        delete_path(s3, "/missing")
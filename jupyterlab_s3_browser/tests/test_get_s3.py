@@ -1,4 +1,10 @@
+import base64
+import io
+import json
+import os
+
 import boto3
+import pytest
 from moto import mock_s3
 
 import jupyterlab_s3_browser
@@ -63,3 +69,54 @@ def test_get_files_inside_bucket():
     assert sorted(result, key=lambda i: i["name"]) == sorted(
         expected_result, key=lambda i: i["name"]
     )
+
+
+@mock_s3
+def test_list_directory():
+    s3 = boto3.client("s3")
+    bucket_name = "test"
+    s3.create_bucket(Bucket=bucket_name)
+    s3.put_object(Bucket=bucket_name, Key="test1.txt", Body=b"test")
+    s3.put_object(Bucket=bucket_name, Key="prefix/test2.txt", Body=b"test2")
+    s3.put_object(Bucket=bucket_name, Key="prefix/nested/test3.txt", Body=b"test3")
+
+    result = jupyterlab_s3_browser.handlers.list_directory(s3, "/test")
+    assert sorted(result, key=lambda i: i["Key"]) == [
+        {"Key": "test/prefix", "type": "directory"},
+        {"Key": "test/test1.txt", "type": "file"},
+    ]
+
+    result = jupyterlab_s3_browser.handlers.list_directory(s3, "/test/prefix/")
+    assert sorted(result, key=lambda i: i["Key"]) == [
+        {"Key": "test/prefix/nested", "type": "directory"},
+        {"Key": "test/prefix/test2.txt", "type": "file"},
+    ]
+
+
+@mock_s3
+def test_list_directory_missing_prefix():
+    s3 = boto3.client("s3")
+    s3.create_bucket(Bucket="test")
+
+    assert jupyterlab_s3_browser.handlers.list_directory(s3, "/test") == []
+    with pytest.raises(FileNotFoundError):
+        jupyterlab_s3_browser.handlers.list_directory(s3, "/test/missing")
+    with pytest.raises(FileNotFoundError):
+        jupyterlab_s3_browser.handlers.list_directory(s3, "/missing")
+
+
+def _decode_file_model(path, content):
+    pieces = jupyterlab_s3_browser.handlers.iter_file_model(path, io.BytesIO(content))
+    model = json.loads(b"".join(pieces))
+    assert model["path"] == path
+    assert model["type"] == "file"
+    return base64.b64decode(model["content"])
+
+
+def test_iter_file_model_empty():
+    assert _decode_file_model("test/empty.txt", b"") == b""
+
+
+def test_iter_file_model_multiple_chunks():
+    content = os.urandom(2 * jupyterlab_s3_browser.handlers.STREAM_CHUNK_SIZE + 1)
+    assert _decode_file_model('test/"quoted".bin', content) == content